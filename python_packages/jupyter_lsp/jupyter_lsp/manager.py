@@ -1,10 +1,10 @@
 """ A configurable frontend for stdio-based Language Servers
 """
 import os
+import sys
 import traceback
-from typing import Dict, Text, Tuple, cast
+from typing import Any, Dict, Optional, Text, Tuple, cast
 
-import entrypoints
 from jupyter_core.paths import jupyter_config_path
 from jupyter_server.services.config import ConfigManager
 from jupyter_server.transutils import _
@@ -32,6 +32,35 @@ from .types import (
     SpecMaker,
 )
 
+# a spec finder, and the validated specs it found
+FoundSpecs = Tuple[SpecMaker, KeyedLanguageServerSpecs]
+
+if sys.version_info >= (3, 8):
+    from importlib import metadata
+
+    def get_entry_points_named(group: Text) -> Dict[Text, Any]:
+        """get the entry points in a group, keyed by name, from the standard
+        library's (much cheaper) distribution metadata
+        """
+        eps = metadata.entry_points()  # type: Any
+        group_eps = (
+            eps.select(group=group) if hasattr(eps, "select") else eps.get(group, [])
+        )
+        named = {}  # type: Dict[Text, Any]
+
+        for ep in group_eps:
+            # as with `entrypoints`, the first distribution found wins
+            named.setdefault(ep.name, ep)
+
+        return named
+
+else:  # pragma: no cover
+    import entrypoints
+
+    def get_entry_points_named(group: Text) -> Dict[Text, Any]:
+        """get the entry points in a group, keyed by name"""
+        return entrypoints.get_group_named(group)
+
 
 class LanguageServerManager(LanguageServerManagerAPI):
     """Manage language servers"""
@@ -58,7 +87,7 @@ class LanguageServerManager(LanguageServerManagerAPI):
         trait=Instance(LanguageServerSession),
         default_value={},
         help="sessions keyed by language server name",
-    )  # type: Dict[Tuple[Text], LanguageServerSession]
+    )  # type: Dict[Text, LanguageServerSession]
 
     virtual_documents_dir = Unicode(
         help="""Path to virtual documents relative to the content manager root
@@ -100,6 +129,7 @@ class LanguageServerManager(LanguageServerManagerAPI):
         """Before starting, perform all necessary configuration"""
         self.all_language_servers: KeyedLanguageServerSpecs = {}
         self._language_servers_from_config = {}
+        self._found_specs: Optional[Dict[Text, FoundSpecs]] = None
         super().__init__(**kwargs)
 
     def initialize(self, *args, **kwargs):
@@ -111,7 +141,11 @@ class LanguageServerManager(LanguageServerManagerAPI):
         """determine the final language server configuration."""
         # copy the language servers before anybody monkeys with them
         self._language_servers_from_config = dict(self.language_servers)
-        self.language_servers = self._collect_language_servers(only_installed=True)
+        self._found_specs = None
+        language_servers = self._collect_language_servers(only_installed=True)
+        # avoid re-validating the whole schema if nothing has changed
+        if language_servers != self.language_servers:
+            self.language_servers = language_servers
         self.all_language_servers = self._collect_language_servers(only_installed=False)
 
     def _collect_language_servers(
@@ -134,12 +168,24 @@ class LanguageServerManager(LanguageServerManagerAPI):
         return {key: spec for key, spec in language_servers.items() if spec.get("argv")}
 
     def init_sessions(self):
-        """create, but do not initialize all sessions"""
+        """create, but do not initialize all sessions
+
+        sessions with unchanged specs are kept, while those which were removed or
+        changed are stopped
+        """
         sessions = {}
         for language_server, spec in self.language_servers.items():
-            sessions[language_server] = LanguageServerSession(
-                language_server=language_server, spec=spec, parent=self
-            )
+            session = self.sessions.get(language_server)
+            if session is None or session.spec != spec:
+                session = LanguageServerSession(
+                    language_server=language_server, spec=spec, parent=self
+                )
+            sessions[language_server] = session
+
+        for language_server, session in self.sessions.items():
+            if sessions.get(language_server) is not session:
+                session.stop()
+
         self.sessions = sessions
 
     def init_listeners(self):
@@ -153,7 +199,7 @@ class LanguageServerManager(LanguageServerManagerAPI):
         for scope, trt_ep in scopes.items():
             listeners, entry_point = trt_ep
 
-            for ep_name, ept in entrypoints.get_group_named(
+            for ep_name, ept in get_entry_points_named(
                 entry_point
             ).items():  # pragma: no cover
                 try:
@@ -176,7 +222,8 @@ class LanguageServerManager(LanguageServerManagerAPI):
             )
             return
 
-        session.handlers = set([handler]) | session.handlers
+        # reassign, rather than mutate, so the session sees the change
+        session.handlers = session.handlers | {handler}
 
     async def on_client_message(self, message, handler):
         await self.wait_for_listeners(
@@ -195,14 +242,9 @@ class LanguageServerManager(LanguageServerManagerAPI):
         session.write(message)
 
     async def on_server_message(self, message, session):
-        language_servers = [
-            ls_key for ls_key, sess in self.sessions.items() if sess == session
-        ]
-
-        for language_servers in language_servers:
-            await self.wait_for_listeners(
-                MessageScope.SERVER, message, language_servers
-            )
+        await self.wait_for_listeners(
+            MessageScope.SERVER, message, session.language_server
+        )
 
         for handler in session.handlers:
             handler.write_message(message)
@@ -218,18 +260,55 @@ class LanguageServerManager(LanguageServerManagerAPI):
             )
             return
 
-        session.handlers = [h for h in session.handlers if h != handler]
+        session.handlers = session.handlers - {handler}
 
     def _autodetect_language_servers(self, only_installed: bool):
+        skipped_servers = []
+
+        for ep_name, (spec_finder, specs) in self._find_specs().items():
+            try:
+                if only_installed:
+                    if hasattr(spec_finder, "is_installed"):
+                        spec_finder_from_base = cast(SpecBase, spec_finder)
+                        if not spec_finder_from_base.is_installed(self):
+                            skipped_servers.append(ep_name)
+                            continue
+            except Exception as err:  # pragma: no cover
+                self.log.warning(
+                    _(
+                        "Failed to check installation of language server spec finder"
+                        " `{}`:\n{}"
+                    ).format(ep_name, err)
+                )
+                traceback.print_exc()
+
+                continue
+
+            for key, spec in specs.items():
+                yield key, spec
+
+        if skipped_servers:
+            self.log.info(
+                _("Skipped non-installed server(s): {}").format(
+                    ", ".join(skipped_servers)
+                )
+            )
+
+    def _find_specs(self) -> Dict[Text, FoundSpecs]:
+        """load, call and validate all of the spec finders, once per
+        `init_language_servers`
+        """
+        if self._found_specs is not None:
+            return self._found_specs
+
+        self._found_specs = found_specs = {}
         entry_points = {}
 
         try:
-            entry_points = entrypoints.get_group_named(EP_SPEC_V1)
+            entry_points = get_entry_points_named(EP_SPEC_V1)
         except Exception:  # pragma: no cover
             self.log.exception("Failed to load entry_points")
 
-        skipped_servers = []
-
         for ep_name, ep in entry_points.items():
             try:
                 spec_finder = ep.load()  # type: SpecMaker
@@ -242,12 +321,6 @@ class LanguageServerManager(LanguageServerManagerAPI):
                 continue
 
             try:
-                if only_installed:
-                    if hasattr(spec_finder, "is_installed"):
-                        spec_finder_from_base = cast(SpecBase, spec_finder)
-                        if not spec_finder_from_base.is_installed(self):
-                            skipped_servers.append(ep.name)
-                            continue
                 specs = spec_finder(self) or {}
             except Exception as err:  # pragma: no cover
                 self.log.warning(
@@ -271,15 +344,9 @@ class LanguageServerManager(LanguageServerManagerAPI):
                 )
                 continue
 
-            for key, spec in specs.items():
-                yield key, spec
+            found_specs[ep_name] = spec_finder, specs
 
-        if skipped_servers:
-            self.log.info(
-                _("Skipped non-installed server(s): {}").format(
-                    ", ".join(skipped_servers)
-                )
-            )
+        return found_specs
 
 
 # the listener decorator
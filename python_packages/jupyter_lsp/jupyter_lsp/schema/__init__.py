@@ -3,6 +3,11 @@ import pathlib
 
 import jsonschema
 
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
+
 HERE = pathlib.Path(__file__).parent
 SCHEMA_FILE = HERE / "schema.json"
 SCHEMA = json.loads(SCHEMA_FILE.read_text(encoding="utf-8"))
@@ -16,8 +21,46 @@ def make_validator(key):
     return jsonschema.validators.Draft7Validator(schema)
 
 
+class CompiledValidator:
+    """a JSON Schema (Draft 7) validator which first checks a value with a
+    compiled `fastjsonschema` validator, if available, and only walks the schema
+    to report the errors of invalid values
+
+    the schema is only compiled when first used, as compiling costs about as much
+    as ten full validations
+    """
+
+    def __init__(self, key):
+        self.validator = make_validator(key)
+        self.compiled = None
+        self.compile_attempted = False
+
+    def compile(self):
+        """try to compile the schema, if `fastjsonschema` is available"""
+        self.compile_attempted = True
+
+        if fastjsonschema is not None:
+            try:
+                self.compiled = fastjsonschema.compile(self.validator.schema)
+            except Exception:
+                # this version can't compile the schema: use the full validator
+                pass
+
+    def iter_errors(self, value):
+        if not self.compile_attempted:
+            self.compile()
+        if self.compiled is not None:
+            try:
+                self.compiled(value)
+            except fastjsonschema.JsonSchemaException:
+                pass
+            else:
+                return iter([])
+        return self.validator.iter_errors(value)
+
+
 SERVERS_RESPONSE = make_validator("servers-response")
 
 LANGUAGE_SERVER_SPEC = make_validator("language-server-spec")
 
-LANGUAGE_SERVER_SPEC_MAP = make_validator("language-server-specs-implementation-map")
+LANGUAGE_SERVER_SPEC_MAP = CompiledValidator("language-server-specs-implementation-map")
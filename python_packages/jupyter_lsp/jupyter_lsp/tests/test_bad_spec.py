@@ -1,19 +1,71 @@
 import pytest
 import traitlets
 
+from jupyter_lsp.schema import (
+    LANGUAGE_SERVER_SPEC_MAP,
+    CompiledValidator,
+    fastjsonschema,
+)
 from jupyter_lsp.session import LanguageServerSession
 
+BAD_SPECS = [
+    {},
+    {"argv": [], "languages": []},
+    {"languages": None},
+    {"languages": 1},
+    {"languages": [1, "two"]},
+]
 
-@pytest.mark.parametrize(
-    "spec",
-    [
-        {},
-        {"argv": [], "languages": []},
-        {"languages": None},
-        {"languages": 1},
-        {"languages": [1, "two"]},
-    ],
-)
+
+@pytest.mark.parametrize("spec", BAD_SPECS)
 def test_bad_spec(spec):
     with pytest.raises(traitlets.TraitError):
         LanguageServerSession(spec=spec)
+
+
+@pytest.fixture(params=["compiled", "not-compiled"])
+def spec_map_compiled(request, monkeypatch):
+    if request.param == "not-compiled":
+        monkeypatch.setattr(LANGUAGE_SERVER_SPEC_MAP, "compiled", None)
+        monkeypatch.setattr(LANGUAGE_SERVER_SPEC_MAP, "compile_attempted", True)
+
+
+@pytest.mark.parametrize("spec", BAD_SPECS)
+def test_bad_spec_map(spec, spec_map_compiled):
+    errors = LANGUAGE_SERVER_SPEC_MAP.iter_errors({"bad": spec})
+    messages = [error.message for error in errors]
+    assert messages
+    assert messages == [
+        error.message
+        for error in LANGUAGE_SERVER_SPEC_MAP.validator.iter_errors({"bad": spec})
+    ]
+
+
+def test_good_spec_map(echo_spec, spec_map_compiled):
+    assert not list(LANGUAGE_SERVER_SPEC_MAP.iter_errors({"_echo_": echo_spec}))
+
+
+@pytest.mark.skipif(fastjsonschema is None, reason="needs fastjsonschema")
+def test_uncompilable_spec_map(monkeypatch):
+    """does the spec map validator fall back if the schema can't be compiled?"""
+
+    def compile(schema):
+        raise ValueError("can't compile")
+
+    monkeypatch.setattr(fastjsonschema, "compile", compile)
+    validator = CompiledValidator("language-server-specs-implementation-map")
+
+    assert list(validator.iter_errors({"bad": {}}))
+    assert validator.compile_attempted
+    assert validator.compiled is None
+
+
+@pytest.mark.skipif(fastjsonschema is None, reason="needs fastjsonschema")
+def test_lazy_compiled_spec_map(echo_spec):
+    """is the spec map schema only compiled once it is used?"""
+    validator = CompiledValidator("language-server-specs-implementation-map")
+    assert not validator.compile_attempted
+    assert validator.compiled is None
+
+    assert not list(validator.iter_errors({"_echo_": echo_spec}))
+    assert validator.compiled is not None
@@ -1,3 +1,6 @@
+from jupyter_lsp import specs
+from jupyter_lsp.constants import EP_SPEC_V1
+from jupyter_lsp.manager import get_entry_points_named
 from jupyter_lsp.specs.r_languageserver import RLanguageServer
 from jupyter_lsp.specs.utils import PythonModuleSpec
 
@@ -39,3 +42,46 @@ def test_missing_python_module_spec():
 
     # we ant the spec even when not installed
     assert "languages" in not_installed_server(mgr=None)["a_module"]
+
+
+def test_find_node_module(manager, tmp_path):
+    """are found node modules remembered until the roots change?"""
+    a_root, b_root = tmp_path / "a", tmp_path / "b"
+    a_module, b_module = [
+        root / "node_modules" / "a-module" for root in (a_root, b_root)
+    ]
+    a_module.mkdir(parents=True)
+    b_module.mkdir(parents=True)
+
+    manager.node_roots = [str(b_root)]
+    assert manager.find_node_module("a-module") == str(b_module)
+
+    manager.extra_node_roots = [str(a_root)]
+    assert manager.find_node_module("a-module") == str(a_module)
+
+    a_module.rmdir()
+    assert manager.find_node_module("a-module") == str(a_module)
+
+
+def test_reinitialize_sessions(manager, echo_spec):
+    """are only the sessions for changed specs replaced on reinitialization?"""
+    manager.autodetect = False
+    manager.language_servers = {"_echo_": echo_spec, "_other_echo_": echo_spec}
+    manager.initialize()
+    echo, other_echo = manager.sessions["_echo_"], manager.sessions["_other_echo_"]
+
+    manager.language_servers = {
+        "_echo_": echo_spec,
+        "_new_echo_": dict(echo_spec, argv=["echo", "still no server here"]),
+    }
+    manager.initialize()
+
+    assert sorted(manager.sessions) == ["_echo_", "_new_echo_"]
+    assert manager.sessions["_echo_"] is echo
+    assert other_echo.status.value == "stopped"
+
+
+def test_get_entry_points_named():
+    """are this package's own spec finders found by name?"""
+    entry_points = get_entry_points_named(EP_SPEC_V1)
+    assert entry_points["python-lsp-server"].load() is specs.py_lsp_server
@@ -1,11 +1,35 @@
 import asyncio
+import json
 import re
 
 import pytest
 import traitlets
 from tornado.queues import Queue
 
+import jupyter_lsp.types
 from jupyter_lsp import lsp_message_listener
+from jupyter_lsp.types import (
+    MessageListener,
+    MessageScope,
+    combined_method_pattern,
+    literal_pattern,
+)
+
+
+@pytest.fixture
+def no_listeners(manager):
+    """hide any already-registered listeners for the duration of a test"""
+    registered = {scope: list(lst) for scope, lst in manager._listeners.items()}
+
+    for lst in manager._listeners.values():
+        lst.clear()
+    manager._on_listeners_changed()
+
+    yield
+
+    for scope, lst in registered.items():
+        manager._listeners[scope][:] = lst
+    manager._on_listeners_changed()
 
 
 @pytest.mark.parametrize("bad_string", ["not-a-function", "jupyter_lsp.__version__"])
@@ -116,3 +140,292 @@ async def test_listeners(known_server, handlers, jsonrpc_init_msg):
     assert not manager._listeners["server"]
     assert not manager._listeners["client"]
     assert len(manager._listeners["all"]) == 1
+
+
+@pytest.mark.parametrize(
+    "language_server,method,message,wanted",
+    [
+        [None, None, {}, True],
+        [None, "initialize", {"method": "initialize"}, True],
+        [None, "initialize", {"method": "shutdown"}, False],
+        [None, "initialize", {"id": 0, "result": {}}, False],
+        [None, "initialize", {"method": "initialized"}, True],
+        [None, "initialize$", {"method": "initialized"}, False],
+        ["pylsp", None, {}, True],
+        ["pyls", None, {}, True],
+        ["not-pylsp", None, {}, False],
+        ["pylsp", "text.*", {"method": "textDocument/hover"}, True],
+        ["pylsp", "text.*", {"method": "initialize"}, False],
+    ],
+)
+def test_listener_wants(language_server, method, message, wanted):
+    """does a listener want the messages it should?"""
+
+    async def listener(scope, message, language_server, manager):  # pragma: no cover
+        pass
+
+    message_listener = MessageListener(
+        listener=listener, language_server=language_server, method=method
+    )
+
+    assert message_listener.wants(message, "pylsp") is wanted
+
+
+def test_listeners_for_language_server(manager):
+    """are the listeners for a language server cached until (un)registration?"""
+
+    async def listener(scope, message, language_server, manager):  # pragma: no cover
+        pass
+
+    def listening(scope, language_server):
+        return [
+            lst.listener
+            for lst in manager.listeners_for_language_server(scope, language_server)
+            if lst.listener == listener
+        ]
+
+    assert not listening("client", "pylsp")
+
+    lsp_message_listener("client", language_server="pylsp")(listener)
+    assert manager._any_listeners
+    assert listening("client", "pylsp") == [listener]
+    assert manager.listeners_for_language_server(
+        "client", "pylsp"
+    ) is manager.listeners_for_language_server("client", "pylsp")
+    assert not listening("client", "r-languageserver")
+    assert not listening("server", "pylsp")
+
+    manager.unregister_message_listener(listener)
+    assert not listening("client", "pylsp")
+
+
+@pytest.mark.parametrize(
+    "method,message,wanted",
+    [
+        ["textDocument/hover$", {"method": "initialize"}, False],
+        [
+            "textDocument/hover$",
+            {"id": 0, "result": {"method": "textDocument/hover"}},
+            False,
+        ],
+        [
+            "textDocument/hover$",
+            {"params": {"method": "initialize"}, "method": "textDocument/hover"},
+            True,
+        ],
+        ["textDocument/hover$", {"method": 'text"Document/hover'}, False],
+        ["textDocument/hover$", '{"me\\u0074hod": "textDocument/hover"}', True],
+        ["textDocument/hover$", '{"method": "textDocument\\/hover"}', True],
+        ["(?i)textdocument/hover$", {"method": "textDocument/hover"}, True],
+        ["(?i)textdocument/hover$", {"method": "initialize"}, False],
+    ],
+)
+@pytest.mark.asyncio
+async def test_wait_for_listeners_methods(
+    manager, no_listeners, method, message, wanted
+):
+    """are messages only parsed and dispatched for listeners that want them?"""
+    listened = []
+    message_str = message if isinstance(message, str) else json.dumps(message)
+
+    @lsp_message_listener("client", method=method)
+    async def listener(scope, message, language_server, manager):
+        listened.append(message)
+
+    @lsp_message_listener("client", method="initialized$")
+    async def other_listener(
+        scope, message, language_server, manager
+    ):  # pragma: no cover
+        pass
+
+    try:
+        await manager.wait_for_listeners(MessageScope.CLIENT, message_str, "pylsp")
+    finally:
+        manager.unregister_message_listener(listener)
+        manager.unregister_message_listener(other_listener)
+
+    assert listened == ([json.loads(message_str)] if wanted else [])
+
+
+@pytest.mark.parametrize(
+    "pattern,literal",
+    [
+        [None, None],
+        ["", None],
+        ["initialize", "initialize"],
+        ["initialize$", None],
+        ["text.*", None],
+    ],
+)
+def test_literal_pattern(pattern, literal):
+    """are only patterns without regular expression syntax treated as literal?"""
+    assert literal_pattern(pattern) == literal
+
+
+@pytest.mark.asyncio
+async def test_wait_for_listeners_parses_once(manager, no_listeners, monkeypatch):
+    """is a message parsed at most once, and only if some listener may want it?"""
+    parsed = []
+    listened = []
+
+    def json_loads(message_str):
+        parsed.append(message_str)
+        return json.loads(message_str)
+
+    monkeypatch.setattr(jupyter_lsp.types, "json_loads", json_loads)
+
+    @lsp_message_listener("server", method=r"textDocument/publishDiagnostics")
+    async def diagnostics_listener(scope, message, language_server, manager):
+        listened.append(message)
+
+    @lsp_message_listener("server", method=r"textDocument/.*")
+    async def document_listener(scope, message, language_server, manager):
+        listened.append(message)
+
+    try:
+        hover = json.dumps({"id": 0, "result": {"contents": []}})
+        await manager.wait_for_listeners(MessageScope.SERVER, hover, "pylsp")
+        assert not parsed
+
+        diagnostics = json.dumps(
+            {"method": "textDocument/publishDiagnostics", "params": {}}
+        )
+        await manager.wait_for_listeners(MessageScope.SERVER, diagnostics, "pylsp")
+        assert parsed == [diagnostics]
+    finally:
+        manager.unregister_message_listener(diagnostics_listener)
+        manager.unregister_message_listener(document_listener)
+
+    assert len(listened) == 2
+    assert listened[0] is listened[1]
+
+
+@pytest.mark.parametrize(
+    "methods,matches,not_matches",
+    [
+        [[], None, None],
+        [[None], None, None],
+        [["initialize", None], None, None],
+        [["(initial)ize"], None, None],
+        [["(?i)textdocument/hover"], None, None],
+        [["initialize", "(?i)textdocument/hover"], None, None],
+        [["initialize", "textDocument/.*"], "textDocument/hover", "shutdown"],
+        [["initialize$", "shutdown"], "initialize", "initialized"],
+    ],
+)
+def test_combined_method_pattern(methods, matches, not_matches):
+    """can the method filters of listeners be combined, and do they still match?"""
+
+    async def listener(scope, message, language_server, manager):  # pragma: no cover
+        pass
+
+    pattern = combined_method_pattern(
+        [
+            MessageListener(listener=listener, language_server=None, method=method)
+            for method in methods
+        ]
+    )
+
+    if matches is None:
+        assert pattern is None
+    else:
+        assert pattern.match(matches)
+        assert not pattern.match(not_matches)
+
+
+def test_unregister_keeps_listener_lists(manager):
+    """are the registered listener lists filtered in place?"""
+
+    async def listener(scope, message, language_server, manager):  # pragma: no cover
+        pass
+
+    listeners = dict(manager._listeners)
+
+    lsp_message_listener("server")(listener)
+    manager.unregister_message_listener(listener)
+
+    assert all(manager._listeners[scope] is listeners[scope] for scope in listeners)
+    assert listener not in [lst.listener for lst in manager._listeners["server"]]
+
+
+def test_listener_cache_size(manager, monkeypatch):
+    """are unknown language servers only cached up to a limit?"""
+
+    @lsp_message_listener("client", method="initialize")
+    async def listener(scope, message, language_server, manager):  # pragma: no cover
+        pass
+
+    monkeypatch.setattr(manager, "_listener_cache_size", 2)
+
+    try:
+        for i in range(5):
+            language_server = "not-a-language-server-{}".format(i)
+            manager.listeners_for_language_server("client", language_server)
+            manager.method_pattern_for_language_server("client", language_server)
+
+        assert len(manager._listener_cache) == 2
+        assert len(manager._method_patterns) == 2
+    finally:
+        manager.unregister_message_listener(listener)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_loader(request, monkeypatch):
+    if request.param == "orjson":
+        if jupyter_lsp.types.orjson is None:  # pragma: no cover
+            pytest.skip("needs orjson")
+    else:
+        monkeypatch.setattr(jupyter_lsp.types, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "message_str,expected",
+    [
+        ['{"method": "a", "text": "a\\u00e9b"}', {"method": "a", "text": "aéb"}],
+        ['{"method": "a", "text": "a\\ud83d b"}', {"method": "a", "text": "a\ud83d b"}],
+        ['{"method": "a", "value": NaN}', None],
+    ],
+)
+def test_json_loads(json_loader, message_str, expected):
+    """are messages parsed as leniently as by the standard library?"""
+    message = jupyter_lsp.types.json_loads(message_str)
+
+    if expected is None:
+        assert message["value"] != message["value"]
+    else:
+        assert message == expected
+
+
+@pytest.mark.asyncio
+async def test_wait_for_no_listeners(manager, no_listeners, monkeypatch):
+    """are messages not even parsed once every listener is unregistered?"""
+    parsed = []
+
+    def json_loads(message_str):  # pragma: no cover
+        parsed.append(message_str)
+        return json.loads(message_str)
+
+    monkeypatch.setattr(jupyter_lsp.types, "json_loads", json_loads)
+
+    assert not manager._any_listeners
+
+    @lsp_message_listener("all")
+    async def listener(scope, message, language_server, manager):  # pragma: no cover
+        pass
+
+    assert manager._any_listeners
+    manager.unregister_message_listener(listener)
+    assert not manager._any_listeners
+
+    def listeners_for_language_server(scope, language_server):  # pragma: no cover
+        raise AssertionError("should return before looking for listeners")
+
+    monkeypatch.setattr(
+        manager, "listeners_for_language_server", listeners_for_language_server
+    )
+
+    message_str = json.dumps({"method": "initialize"})
+    await manager.wait_for_listeners(MessageScope.CLIENT, message_str, "pylsp")
+    await manager.wait_for_listeners(MessageScope.SERVER, message_str, "pylsp")
+    assert not parsed
@@ -7,6 +7,7 @@ import pathlib
 import re
 import shutil
 import sys
+from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,16 +17,23 @@ from typing import (
     List,
     Optional,
     Pattern,
+    Set,
     Text,
+    Tuple,
     Union,
 )
 
 from jupyter_server.transutils import _
-from traitlets import Instance
+from traitlets import Bunch, Instance
 from traitlets import List as List_
-from traitlets import Unicode, default
+from traitlets import Unicode, default, observe
 from traitlets.config import LoggingConfigurable
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 LanguageServerSpec = Dict[Text, Any]
 LanguageServerMessage = Dict[Text, Any]
 KeyedLanguageServerSpecs = Dict[Text, LanguageServerSpec]
@@ -44,6 +52,58 @@ if TYPE_CHECKING:  # pragma: no cover
             ...
 
 
+def json_loads(message_str: Text) -> Any:
+    """parse a message, with `orjson` if available, falling back to the more
+    lenient standard library for e.g. lone surrogates or `NaN`
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(message_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(message_str)
+
+
+# a cheap scan for the `method`s in an unparsed message: in valid JSON, this can
+# only match an object key, but not necessarily the top-level one, and misses
+# keys and values spelled with escapes
+RE_MESSAGE_METHOD = re.compile(r'"method"\s*:\s*"([^"]*)"')
+
+
+def literal_pattern(pattern: Optional[Text]) -> Optional[Text]:
+    """the pattern, if it has no regular expression syntax
+
+    as with `re.match`, a literal pattern matches any text it is a prefix of
+    """
+    return pattern if pattern and re.escape(pattern) == pattern else None
+
+
+def combined_method_pattern(
+    listeners: List["MessageListener"],
+) -> Optional[Pattern[Text]]:
+    """a single pattern matching any method some listener wants, if all of the
+    listeners filter on `method`
+
+    patterns with groups are not combined, as their backreferences would shift,
+    nor are those with (inline) flags, which would apply to every alternative or
+    not compile at all
+    """
+    methods = [listener.method for listener in listeners]
+
+    if not methods or any(
+        method is None or method.groups or method.flags & ~re.UNICODE
+        for method in methods
+    ):
+        return None
+
+    try:
+        return re.compile(
+            "|".join("(?:{})".format(method.pattern) for method in methods if method)
+        )
+    except re.error:  # pragma: no cover
+        return None
+
+
 class SessionStatus(enum.Enum):
     """States in which a language server session can be"""
 
@@ -78,6 +138,8 @@ class MessageListener(object):
         self.listener = listener
         self.language_server = re.compile(language_server) if language_server else None
         self.method = re.compile(method) if method else None
+        self._language_server_literal = literal_pattern(language_server)
+        self._method_literal = literal_pattern(method)
 
     async def __call__(
         self,
@@ -108,15 +170,42 @@ class MessageListener(object):
         `method` is currently the only message content discriminator, but not
         all messages will have a `method`
         """
+        return self.wants_message(message) and self.wants_language_server(
+            language_server
+        )
+
+    def wants_message(self, message: LanguageServerMessage) -> bool:
+        """whether this listener wants a particular message, regardless of which
+        language server it is to or from
+        """
         if self.method:
             method = message.get("method")
 
-            if method is None or re.match(self.method, method) is None:
+            if method is None or not self._matches_method(method):
                 return False
-        return self.language_server is None or re.match(
-            self.language_server, language_server
+        return True
+
+    def could_want_methods(self, methods: Set[Text]) -> bool:
+        """whether this listener could want a message, given all of the `method`s
+        found in its unparsed text
+        """
+        return not self.method or any(
+            self._matches_method(method) for method in methods
         )
 
+    def wants_language_server(self, language_server: Text) -> bool:
+        """whether this listener wants any messages for a language server"""
+        if self.language_server is None:
+            return True
+        if self._language_server_literal is not None:
+            return language_server.startswith(self._language_server_literal)
+        return self.language_server.match(language_server) is not None
+
+    def _matches_method(self, method: Text) -> bool:
+        if self._method_literal is not None:
+            return method.startswith(self._method_literal)
+        return self.method is not None and self.method.match(method) is not None
+
     def __repr__(self):
         return (
             "<MessageListener"
@@ -131,6 +220,19 @@ class HasListeners:
         str(scope.value): [] for scope in MessageScope
     }  # type: Dict[Text, List[MessageListener]]
 
+    # listeners which want a language server, keyed by scope and language server
+    _listener_cache = {}  # type: Dict[Tuple[Text, Text], List[MessageListener]]
+
+    # combined method patterns of the cached listeners, keyed in the same way
+    _method_patterns = {}  # type: Dict[Tuple[Text, Text], Optional[Pattern[Text]]]
+
+    # language server names come from client URLs, so bound the caches: beyond
+    # this many keys, listeners are found anew for every message
+    _listener_cache_size = 256
+
+    # whether any listeners are registered in any scope
+    _any_listeners = False
+
     log = Instance("logging.Logger")
 
     @classmethod
@@ -149,6 +251,7 @@ class HasListeners:
                     listener=listener, language_server=language_server, method=method
                 )
             )
+            cls._on_listeners_changed()
             return listener
 
         return inner
@@ -157,20 +260,97 @@ class HasListeners:
     def unregister_message_listener(cls, listener: "HandlerListenerCallback"):
         """unregister a listener for language server protocol messages"""
         for scope in MessageScope:
-            cls._listeners[str(scope.value)] = [
-                lst
-                for lst in cls._listeners[str(scope.value)]
-                if lst.listener != listener
+            # filter in place, so the lists keep their identity
+            listeners = cls._listeners[str(scope.value)]
+            listeners[:] = [lst for lst in listeners if lst.listener != listener]
+        cls._on_listeners_changed()
+
+    @classmethod
+    def _on_listeners_changed(cls):
+        """invalidate the state derived from the registered listeners"""
+        cls._listener_cache.clear()
+        cls._method_patterns.clear()
+        # set on the base, to be seen by every subclass which shares `_listeners`
+        HasListeners._any_listeners = any(cls._listeners.values())
+
+    def listeners_for_language_server(
+        self, scope: Text, language_server: Text
+    ) -> List[MessageListener]:
+        """get the (cached) listeners in a scope which want a language server"""
+        key = (scope, language_server)
+        listeners = self._listener_cache.get(key)
+
+        if listeners is None:
+            listeners = [
+                listener
+                for listener in chain(
+                    self._listeners[scope], self._listeners[MessageScope.ALL.value]
+                )
+                if listener.wants_language_server(language_server)
             ]
 
+            if len(self._listener_cache) < self._listener_cache_size:
+                self._listener_cache[key] = listeners
+
+        return listeners
+
+    def method_pattern_for_language_server(
+        self, scope: Text, language_server: Text
+    ) -> Optional[Pattern[Text]]:
+        """get the (cached) combined method pattern of the listeners in a scope
+        which want a language server
+        """
+        key = (scope, language_server)
+
+        if key in self._method_patterns:
+            return self._method_patterns[key]
+
+        method_pattern = combined_method_pattern(
+            self.listeners_for_language_server(scope, language_server)
+        )
+
+        if len(self._method_patterns) < self._listener_cache_size:
+            self._method_patterns[key] = method_pattern
+
+        return method_pattern
+
     async def wait_for_listeners(
         self, scope: MessageScope, message_str: Text, language_server: Text
     ) -> None:
+        if not HasListeners._any_listeners:
+            return
+
         scope_val = str(scope.value)
-        listeners = self._listeners[scope_val] + self._listeners[MessageScope.ALL.value]
+        listeners = self.listeners_for_language_server(scope_val, language_server)
+
+        if listeners and any(listener.method for listener in listeners):
+            methods = set(RE_MESSAGE_METHOD.findall(message_str))
+
+            # escaped keys or values would need a full parse to compare
+            escaped = (
+                "\\u" in message_str
+                or (not methods and "\\" in message_str)
+                or any("\\" in method for method in methods)
+            )
+
+            if not escaped:
+                method_pattern = self.method_pattern_for_language_server(
+                    scope_val, language_server
+                )
+
+                if method_pattern is not None and not any(
+                    method_pattern.match(method) for method in methods
+                ):
+                    return
+
+                listeners = [
+                    listener
+                    for listener in listeners
+                    if listener.could_want_methods(methods)
+                ]
 
         if listeners:
-            message = json.loads(message_str)
+            message = json_loads(message_str)
 
             futures = [
                 listener(
@@ -180,10 +360,13 @@ class HasListeners:
                     manager=self,
                 )
                 for listener in listeners
-                if listener.wants(message, language_server)
+                if listener.wants_message(message)
             ]
 
-            if futures:
+            if len(futures) == 1:
+                # the common case needs no gathering
+                await futures[0]
+            elif futures:
                 await asyncio.gather(*futures)
 
 
@@ -200,16 +383,26 @@ class LanguageServerManagerAPI(LoggingConfigurable, HasListeners):
         [], help=_("additional absolute paths to seek node_modules first")
     ).tag(config=True)
 
+    # node modules already found, keyed by path fragments, until the roots change
+    _found_node_modules = None  # type: Optional[Dict[Tuple[Text, ...], Text]]
+
     def find_node_module(self, *path_frag):
         """look through the node_module roots to find the given node module"""
+        if self._found_node_modules is None:
+            self._found_node_modules = {}
+
+        found = self._found_node_modules.get(path_frag)
+
+        if found is not None:
+            return found
+
         all_roots = self.extra_node_roots + self.node_roots
-        found = None
 
         for candidate_root in all_roots:
             candidate = pathlib.Path(candidate_root, "node_modules", *path_frag)
             self.log.debug("Checking for %s", candidate)
             if candidate.exists():
-                found = str(candidate)
+                found = self._found_node_modules[path_frag] = str(candidate)
                 break
 
         if found is None:  # pragma: no cover
@@ -221,6 +414,11 @@ class LanguageServerManagerAPI(LoggingConfigurable, HasListeners):
 
         return found
 
+    @observe("node_roots", "extra_node_roots")
+    def _on_node_roots(self, change: Bunch):
+        """forget the found node modules, which may now be found elsewhere"""
+        self._found_node_modules = None
+
     @default("nodejs")
     def _default_nodejs(self):
         return (